@@ -156,9 +156,8 @@ class CryoCoolerSim:
         s.PT1 = min(s.PT1, self.PSV_open_bar - 0.5)
         s.PT3 = min(s.PT3, self.PSV_open_bar - 0.5)
 
-    def _update_temperatures(self, dt: float, power_W: float):
+    def _update_temperatures(self, dt: float, power_W: float, Q_loop: float, Q_eff: float):
         s, u = self.state, self.controls
-        Q_loop, Q_eff = self.flow_loop_and_eff()
         s.FT18 = Q_loop
         Rsc = self._rsc()
         T_supply_star = max(77.0, self.T_boil(s.PT1) - self.delta_subcool * Rsc)
@@ -181,9 +180,8 @@ class CryoCoolerSim:
         dT_load = (power_W / (mdot * self.cp)) if mdot > 1e-6 else 0.0
         s.T6 = s.T5 + dT_load
 
-    def _update_levels(self, dt: float, power_W: float):
+    def _update_levels(self, dt: float, power_W: float, Q_loop: float, Q_eff: float):
         s, u = self.state, self.controls
-        Q_loop, Q_eff = self.flow_loop_and_eff()
         has_loop_flow = Q_eff > 1e-6
         # 기본 손실(base)은 루프 유량과 무관하게 항상 적용한다.
         cons_Lps = float(self.base_cons_Lps)
@@ -212,8 +210,10 @@ class CryoCoolerSim:
 
     def step(self, dt: float = 1.0, power_W: float = 0.0):
         self._update_pressures(dt)
-        self._update_temperatures(dt, power_W)
-        self._update_levels(dt, power_W)
+        # 유량은 controls에만 의존하므로 스텝당 1회만 계산해 공유한다
+        Q_loop, Q_eff = self.flow_loop_and_eff()
+        self._update_temperatures(dt, power_W, Q_loop, Q_eff)
+        self._update_levels(dt, power_W, Q_loop, Q_eff)
         return self.state
 
 
@@ -13,7 +13,7 @@ Operating logic focused on Main/Mode commands.
 
 from dataclasses import dataclass
 from enum import Enum
-from .commands import MainCmd, ModeCmd, mode_to_auto
+from .commands import MainCmd, ModeCmd, OperState, mode_to_auto
 
 
 """Command policy: transitions and mapping to sequencer autos.
@@ -23,6 +23,17 @@ values and returns/acts on pure Python state to keep unit tests simple.
 """
 
 
+# next_state 핫패스용 정수 상수: 틱마다 문자열 키로 dict를 조회하는 대신
+# IntEnum 멤버 값을 모듈 로드 시 한 번만 바인딩한다.
+_ST_OFF = OperState.OFF.value
+_ST_INIT = OperState.INIT.value
+_ST_PRECOOL = OperState.PRECOOL.value
+_ST_RUN = OperState.RUN.value
+_ST_HOLD = OperState.HOLD.value
+_ST_WARMUP = OperState.WARMUP.value
+_ST_SAFE_SHUTDOWN = OperState.SAFE_SHUTDOWN.value
+
+
 class ActionType(Enum):
     NONE = "NONE"
     START_AUTO = "START_AUTO"        # auto_name 필드 사용
@@ -71,7 +82,6 @@ class OperatingLogic:
         self,
         *,
         state: int,
-        STATE: dict[str, int],
         cmd_val: int,
         mode_val: int,
         tsp: float,
@@ -97,41 +107,41 @@ class OperatingLogic:
         # Command-driven transitions
         if cmd is MainCmd.START:
             if int(mode_val) == ModeCmd.WARM_UP:
-                state = STATE.get("WARMUP", state)
+                state = _ST_WARMUP
             else:
-                state = STATE.get("INIT", state)
+                state = _ST_INIT
             if prev != state:
                 self._t_init_left = self.params.init_seconds
         elif cmd is MainCmd.STOP:
-            state = STATE.get("OFF", state)
+            state = _ST_OFF
         elif cmd is MainCmd.HOLD:
-            state = STATE.get("HOLD", state)
-        elif cmd is MainCmd.RESUME and prev == STATE.get("HOLD", -999):
-            state = STATE.get("RUN", state)
+            state = _ST_HOLD
+        elif cmd is MainCmd.RESUME and prev == _ST_HOLD:
+            state = _ST_RUN
         elif cmd is MainCmd.OFF:
-            state = STATE.get("OFF", state)
-        elif cmd is MainCmd.RESET and prev == STATE.get("SAFE_SHUTDOWN", -999):
-            state = STATE.get("OFF", state)
+            state = _ST_OFF
+        elif cmd is MainCmd.RESET and prev == _ST_SAFE_SHUTDOWN:
+            state = _ST_OFF
 
         # Timed INIT -> PRECOOL
-        if state == STATE.get("INIT", -1):
+        if state == _ST_INIT:
             self._t_init_left -= dt
             if self._t_init_left <= 0:
-                state = STATE.get("PRECOOL", state)
+                state = _ST_PRECOOL
 
         # PRECOOL -> RUN near setpoint
         try:
-            if state == STATE.get("PRECOOL", -1):
+            if state == _ST_PRECOOL:
                 if float(t5) <= (float(tsp) - float(self.params.precool_band)):
-                    state = STATE.get("RUN", state)
+                    state = _ST_RUN
         except Exception:
             pass
 
         # WARMUP -> OFF near ambient
         try:
-            if state == STATE.get("WARMUP", -1):
+            if state == _ST_WARMUP:
                 if float(t5) >= (float(tamb) - 1.0):
-                    state = STATE.get("OFF", state)
+                    state = _ST_OFF
         except Exception:
             pass
 
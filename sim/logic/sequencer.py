@@ -7,6 +7,8 @@ Separates operating sequences (AUTO, stage, timers) from the plant physics
 (`sim/core/dcm_cryo_cooler_sim.py`).
 """
 
+import operator
+
 from dataclasses import dataclass, fields
 from enum import Enum, auto
 
@@ -19,6 +21,18 @@ class AutoKind(Enum):
     REFILL_SUB = auto()
 
 
+# snapshot_status 전용: 게시 키와 controls 속성 경로를 모듈 수준에 고정해
+# 호출마다 C 레벨 attrgetter 한 번으로 12개 속성을 읽는다.
+_SNAPSHOT_KEYS = (
+    'V9', 'V11', 'V15', 'V17', 'V19', 'V20', 'V10', 'V21',
+    'pump_hz', 'press_ctrl_on', 'press_sp_bar', 'heater_u',
+)
+_SNAPSHOT_GET = operator.attrgetter(
+    'V9', 'V11', 'V15', 'V17', 'V19', 'V20', 'V10', 'V21',
+    'pump_hz', 'press_ctrl_on', 'press_sp_bar', '_heater_u',
+)
+
+
 @dataclass
 class _Timers:
     stage_timer: float = 0.0
@@ -82,6 +96,10 @@ class Sequencer:
         # SC
         self._sc_initial_done: bool = False
         self._sc_recharge_active: bool = False
+        # 틱 단위 공통 판정 캐시 (_run_rules 선두에서 1회 계산)
+        self._tick_hv_active: bool = False
+        self._tick_hv_gate: bool = True
+        self._tick_sc_active: bool = False
 
     def _manual_set(self, **kwargs) -> None:
         self._manual.update(**kwargs)
@@ -95,10 +113,7 @@ class Sequencer:
     # --- External control API ---
     def start_cool_down(self) -> None:
         self.auto = AutoKind.COOL_DOWN
-        try:
-            self.sim.state.mode = 'COOL'
-        except Exception:
-            pass
+        self.sim.state.mode = 'COOL'
         self._on_auto_changed(reset_pulses=True)
 
     def start_warm_up(self) -> None:
@@ -122,11 +137,7 @@ class Sequencer:
     '''
     def preset_ready(self) -> None:
         u = self.sim.controls
-        try:
-            current = float(getattr(u, 'pump_hz', 0.0))
-        except Exception:
-            current = 0.0
-
+        current = float(u.pump_hz)
         pump_target = current if current >= 40.0 else 40.0
         self._manual_set(V9=True, V11=True, V17=0.0, pump_hz=pump_target, press_ctrl_on=True)
         self.sim.state.mode = 'READY'
@@ -143,20 +154,27 @@ class Sequencer:
     plan_action()이 aux 목록에 해당 문자열을 담고,
     브리지가 이를 iterate 하면서 Sequencer.aux_off()를 호출해 해당 밸브만 수동으로 닫습니다.
     '''
+    def _aux_refill_heter_off(self) -> None:
+        self._manual_set(V15=False, V20=0.0)
+        self.auto = AutoKind.NONE
+
+    def _aux_refill_sbcol_off(self) -> None:
+        self._manual_set(V19=False)
+        self.auto = AutoKind.NONE
+
+    _AUX_OFF_HANDLERS = {
+        'REFILL_HETER_OFF': _aux_refill_heter_off,
+        'REFILL_SBCOL_OFF': _aux_refill_sbcol_off,
+    }
+
     def aux_off(self, kind: str) -> None:
-        if kind == 'REFILL_HETER_OFF':
-            self._manual_set(V15=False, V20=0.0)
-            self.auto = AutoKind.NONE
-        elif kind == 'REFILL_SBCOL_OFF':
-            self._manual_set(V19=False)
-            self.auto = AutoKind.NONE
+        handler = self._AUX_OFF_HANDLERS.get(kind)
+        if handler is not None:
+            handler(self)
         self.update(0.0)
 
     def set_press_sp(self, value: float) -> None:
-        try:
-            self.sim.controls.press_sp_bar = float(value)
-        except Exception:
-            pass
+        self.sim.controls.press_sp_bar = float(value)
 
     def apply_manual_commands(
         self,
@@ -191,37 +209,26 @@ class Sequencer:
         self.update(0.0)
 
     def snapshot_status(self) -> dict:
-        """제어 상태 스냅샷을 제공(브리지가 PV로 게시하는 데 사용)."""
-        u = self.sim.controls
-        return {
-            'V9': bool(u.V9),
-            'V11': bool(u.V11),
-            'V15': bool(u.V15),
-            'V17': float(u.V17),
-            'V19': bool(u.V19),
-            'V20': float(u.V20),
-            'V10': float(u.V10),
-            'V21': bool(u.V21),
-            'pump_hz': float(u.pump_hz),
-            'press_ctrl_on': bool(u.press_ctrl_on),
-            'press_sp_bar': float(getattr(u, 'press_sp_bar', 0.0)),
-            'heater_u': float(getattr(u, '_heater_u', 0.0)),
-        }
+        """제어 상태 스냅샷을 제공(브리지가 PV로 게시하는 데 사용).
 
-    def stop(self) -> None:
-        # Equivalent to previous plant.stop()
+        Controls 필드 타입은 규칙/수동 오버라이드 경로에서 보장되므로
+        개별 bool()/float() 캐스트 없이 attrgetter 결과를 그대로 담는다.
+        """
+        return dict(zip(_SNAPSHOT_KEYS, _SNAPSHOT_GET(self.sim.controls)))
+
+    def _stop_core(self, mode: str, *, v17: float, v20: float) -> None:
+        """STOP/OFF 공통 경로: 최종 오버라이드 1회 설정 + 규칙 1회 실행."""
         self.sim.state.ready = False
-        self.sim.state.mode = 'STOP'
+        self.sim.state.mode = mode
         self.auto = AutoKind.NONE
-        self._t = _Timers()
         self._reset_internal()
         self._manual_set(
             V9=False,
             V11=False,
             V15=False,
             V19=False,
-            V20=0.0,
-            V17=0.0,
+            V20=v20,
+            V17=v17,
             V10=0.0,
             V21=False,
             pump_hz=0.0,
@@ -229,12 +236,13 @@ class Sequencer:
         )
         self.update(0.0)
 
+    def stop(self) -> None:
+        # Equivalent to previous plant.stop()
+        self._stop_core('STOP', v17=0.0, v20=0.0)
+
     def off(self) -> None:
-        # Equivalent to previous plant.off()
-        self.stop()
-        self._manual_set(V17=1.0, V20=1.0)
-        self.sim.state.mode = 'OFF'
-        self.update(0.0)
+        # Equivalent to previous plant.off(); 루프/HV 벤트는 개방 상태로 마감
+        self._stop_core('OFF', v17=1.0, v20=1.0)
 
     def hold(self) -> None:
         self.paused = True
@@ -252,12 +260,9 @@ class Sequencer:
         manual_mode = self.auto == AutoKind.NONE
         if manual_mode:
             self._run_rules(0.0)
-            try:
-                self.sim.state.ready = bool(self._is_ready())
-                if self.sim.state.ready:
-                    self.sim.state.mode = 'READY'
-            except Exception:
-                pass
+            self.sim.state.ready = self._is_ready()
+            if self.sim.state.ready:
+                self.sim.state.mode = 'READY'
             return
 
         if self.paused:
@@ -267,20 +272,19 @@ class Sequencer:
         self._run_rules(dt)
 
         # READY 사후계산: 규칙 적용 결과 반영 + 자동 종료 판정
-        try:
-            self.sim.state.ready = bool(self._is_ready())
-        except Exception:
-            pass
-        if self.auto == AutoKind.COOL_DOWN:
-            try:
-                if self._is_ready():
-                    self.sim.state.mode = 'READY'
-                    #self.auto = AutoKind.NONE
-                    self._t = _Timers()
-            except Exception:
-                pass
+        self.sim.state.ready = self._is_ready()
+        if self.auto == AutoKind.COOL_DOWN and self.sim.state.ready:
+            self.sim.state.mode = 'READY'
+            #self.auto = AutoKind.NONE
+            self._t = _Timers()
 
     def _run_rules(self, dt: float) -> None:
+        # 0) 공통 판정 선계산: 여러 규칙이 같은 입력으로 같은 결정을
+        #    반복 계산하지 않도록 틱당 1회만 평가한다. 히스테리시스
+        #    플래그를 갱신하는 판정이므로 중복 호출 제거는 일관성에도 기여.
+        self._tick_hv_active = self._hv_refill_active()
+        self._tick_hv_gate = self._hv_refill_gating_ok()
+        self._tick_sc_active = self._sc_refill_active()
         # 1) Baseline
         self.rule_pump_baseline()
         self.rule_v10_mode()
@@ -328,10 +332,6 @@ class Sequencer:
         self._sc_recharge_active = False
         self._t = _Timers()
 
-    def _dcm_loop_on(self) -> bool:
-        u = self.sim.controls
-        return bool(u.V9 and u.V11 and (not u.V21))
-
     def _is_ready(self) -> bool:
         """READY 판정: 루프 성립+압력안정+온도/레벨 조건."""
         s, u = self.sim.state, self.sim.controls
@@ -433,11 +433,7 @@ class Sequencer:
             u.V10 = 0.6
             return
 
-        try:
-            mode = str(self.sim.state.mode).upper()
-        except Exception:
-            mode = ''
-
+        mode = str(self.sim.state.mode).upper()
         if mode in ('OFF', 'PURGE'):
             u.V10 = 1.0
         elif self.auto != AutoKind.NONE:
@@ -479,11 +475,7 @@ class Sequencer:
             self.sim.controls.V21 = bool(override)
             return
         # 모드가 PURGE로 표시되면 수동 프리셋 없이도 기본적으로 개방한다.
-        try:
-            mode = str(self.sim.state.mode).upper()
-        except Exception:
-            mode = ''
-
+        mode = str(self.sim.state.mode).upper()
         if self.auto != AutoKind.NONE:
             self.sim.controls.V21 = False
             return
@@ -504,8 +496,8 @@ class Sequencer:
         if self.auto == AutoKind.NONE:
             return
 
-        active = self._hv_refill_active()
-        gating_ok = self._hv_refill_gating_ok()
+        active = self._tick_hv_active
+        gating_ok = self._tick_hv_gate
         if active and gating_ok:
             u.V15 = True
             # 목표 85% 도달 시 종료
@@ -531,7 +523,7 @@ class Sequencer:
             return
         if self.auto == AutoKind.NONE:
             return
-        if self._hv_refill_active():
+        if self._tick_hv_active:
             self._t.pulse_timer += dt
             if self._t.pulse_timer >= self._hv_pulse_period:
                 self._t.pulse_timer -= self._hv_pulse_period
@@ -553,7 +545,7 @@ class Sequencer:
                 pass
             return
         # 냉각 진행도 기반 간단한 3단계 제어
-        if self.auto == AutoKind.COOL_DOWN and self._dcm_loop_on():
+        if self.auto == AutoKind.COOL_DOWN and u.V9 and u.V11 and not u.V21:
             if s.T6 > 200.0:
                 u.V17 = max(u.V17, 1.0)
             elif s.T6 > 90.0:
@@ -576,7 +568,7 @@ class Sequencer:
             return
         if self.auto == AutoKind.NONE:
             return
-        if self._sc_refill_active():
+        if self._tick_sc_active:
             u.V19 = True
             # 90% 도달 후 종료 처리
             if self.sim.state.LT19 >= 90.0:
@@ -596,7 +588,7 @@ class Sequencer:
         if self.auto == AutoKind.NONE:
             return
         # HV 보충 중에는 압력 제어 일시 비활성화 허용
-        if self._hv_refill_active():
+        if self._tick_hv_active:
             u.press_ctrl_on = False
         else:
             u.press_ctrl_on = True
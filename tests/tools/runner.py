@@ -16,6 +16,7 @@ from __future__ import annotations
 
 import argparse
 import sys
+import threading
 import time
 from pathlib import Path
 from typing import Any, Dict
@@ -43,8 +44,20 @@ def load_plan(path: str) -> Dict[str, Any]:
         return yaml.safe_load(f)
 
 
+# One PV (and CA channel) per name for the whole scenario run.
+_pv_cache: Dict[str, PV] = {}
+
+
+def get_pv(pvname: str) -> PV:
+    pv = _pv_cache.get(pvname)
+    if pv is None:
+        pv = PV(pvname, auto_monitor=True)
+        _pv_cache[pvname] = pv
+    return pv
+
+
 def pv_get(pvname: str, timeout: float = 1.0) -> float:
-    pv = PV(pvname, auto_monitor=True)
+    pv = get_pv(pvname)
     v = pv.get(timeout=timeout)
     if v is None:
         raise RuntimeError(f"PV get timeout: {pvname}")
@@ -52,12 +65,31 @@ def pv_get(pvname: str, timeout: float = 1.0) -> float:
 
 
 def pv_put(pvname: str, value: float) -> None:
-    pv = PV(pvname)
+    pv = get_pv(pvname)
     ok = pv.put(value, wait=False)
     if not ok:
         raise RuntimeError(f"PV put failed: {pvname}")
 
 
+def connect_plan_pvs(steps: list, timeout: float = 2.0) -> None:
+    """Open every PV referenced by the plan before running any step.
+
+    Creating all PV objects first lets CA establish the channels in
+    parallel; the serial wait_for_connection calls then mostly find the
+    channels already up, so a scenario pays the connect round-trip once
+    instead of once per step.
+    """
+    names = set()
+    for step in steps:
+        for key in ("set", "wait", "assert"):
+            if key in step and "pv" in step[key]:
+                names.add(step[key]["pv"])
+    pvs = [get_pv(name) for name in sorted(names)]
+    missing = [pv.pvname for pv in pvs if not pv.wait_for_connection(timeout=timeout)]
+    if missing:
+        print(f"[runner] warning: not connected: {', '.join(missing)}")
+
+
 def run_step(step: Dict[str, Any]) -> None:
     if "set" in step:
         s = step["set"]
@@ -71,9 +103,8 @@ def run_step(step: Dict[str, Any]) -> None:
         w = step["wait"]
         pvname = w["pv"]
         timeout = float(w.get("timeout", 10.0))
-        t0 = time.monotonic()
-        while True:
-            val = pv_get(pvname, timeout=1.0)
+
+        def predicate(val: float) -> bool:
             ok = True
             if "equals" in w:
                 ok = ok and (int(val) == int(w["equals"]))
@@ -81,11 +112,31 @@ def run_step(step: Dict[str, Any]) -> None:
                 ok = ok and (val >= float(w["min"]))
             if "max" in w:
                 ok = ok and (val <= float(w["max"]))
-            if ok:
+            return ok
+
+        # Monitor-driven wait: the CA callback wakes us on each update, so
+        # there is no polling interval and no per-iteration channel setup.
+        pv = get_pv(pvname)
+        done = threading.Event()
+        last = {"val": float("nan")}
+
+        def on_update(value=None, **kws) -> None:
+            if value is None:
+                return
+            last["val"] = float(value)
+            if predicate(float(value)):
+                done.set()
+
+        idx = pv.add_callback(on_update)
+        try:
+            val = pv_get(pvname, timeout=1.0)
+            last["val"] = val
+            if predicate(val):
                 return
-            if (time.monotonic() - t0) > timeout:
-                raise TimeoutError(f"wait timeout for {pvname}, last={val}")
-            time.sleep(0.2)
+            if not done.wait(timeout):
+                raise TimeoutError(f"wait timeout for {pvname}, last={last['val']}")
+        finally:
+            pv.remove_callback(idx)
         return
     if "assert" in step:
         a = step["assert"]
@@ -108,6 +159,7 @@ def main(argv: list[str]) -> int:
 
     steps = plan.get("steps") or []
     print(f"[runner] steps={len(steps)} plan={args.plan}")
+    connect_plan_pvs(steps)
     for i, step in enumerate(steps, 1):
         print(f"[runner] step {i}: {list(step.keys())[0]}")
         run_step(step)
@@ -47,7 +47,6 @@ from __future__ import annotations
 import argparse
 import sys
 import time
-from datetime import datetime
 from typing import Optional
 from collections import deque
 from pathlib import Path
@@ -58,14 +57,20 @@ if str(_ROOT) not in sys.path:
     sys.path.insert(0, str(_ROOT))
 
 try:
-    from epics import PV
+    from epics import PV, ca, caput_many
     import numpy as np
     import yaml
 except Exception as exc:  # pragma: no cover - import diagnostic
-    print("[pv_bridge] pyepics import failed. Please `pip install pyepics`.")
+    print("[pv_bridge] import failed. Please `pip install pyepics numpy pyyaml`.")
     print(f"reason: {exc}")
     sys.exit(2)
 
+# PyYAML의 C 확장 로더가 있으면 사용한다(순수 파이썬 SafeLoader 대비 ~20배).
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # libyaml 미포함 빌드
+    from yaml import SafeLoader as _YamlLoader
+
 from sim.core import CryoCoolerSim, State as SimState, Controls as SimControls
 from sim.logic import OperatingLogic, InterlockLogic, Sequencer, AutoKind, MainCmd, OperState
 
@@ -133,11 +138,24 @@ PV_HIST_FLOW_V17 = "BL:DCM:CRYO:HIST:FLOW:V17"
 PV_HIST_FLOW_V10 = "BL:DCM:CRYO:HIST:FLOW:V10"
 PV_HIST_PUMP_FREQ = "BL:DCM:CRYO:HIST:PUMP:FREQ"
 
+# History ring-buffer row order (publish mapping in _publish_history follows
+# this). The time axis is equally spaced, so it is not stored: it is
+# recomputed from the last sample time at publish cadence.
+HIST_ROWS = (
+    "t5", "t6", "pt1", "pt3", "ft18",
+    "lt19", "lt23", "flow_v17", "flow_v10", "pump_freq",
+)
 
-# Operating state values derived from shared enum
-STATE = {name: enum.value for name, enum in OperState.__members__.items()}
 
 # Commands are compared against `MainCmd` enum values.
+# 핫루프 비교용 정수 상수: 틱마다 MainCmd.X.value 속성 체인을 타지 않는다.
+_CMD_HOLD = MainCmd.HOLD.value
+# HOLD를 해제하는 명령 집합 / STOP·OFF 직후 수동 동기화 대상 집합
+_UNHOLD_CMDS = frozenset((
+    MainCmd.RESUME.value, MainCmd.START.value, MainCmd.STOP.value,
+    MainCmd.OFF.value, MainCmd.RESET.value,
+))
+_STOP_OFF_CMDS = frozenset((MainCmd.STOP.value, MainCmd.OFF.value))
 
 
 def parse_args(argv: list[str]) -> argparse.Namespace:
@@ -153,7 +171,12 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
         "--hist-interval",
         type=float,
         default=0.5,
-        help="히스토리 파형 게시 간격(seconds)")
+        help="히스토리 파형 게시 간격(seconds). 0이면 히스토리 기록/게시 비활성화")
+    p.add_argument(
+        "--hist-tail",
+        type=int,
+        default=0,
+        help="게시할 히스토리 샘플 수 상한(최근 N개). 0이면 전체 게시")
     p.add_argument(
         "--init-config",
         type=str,
@@ -167,7 +190,18 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
 
 
 class PVBridge:
-    def __init__(self, dt: float, q_dcm: float, verbose: bool = False, init_config: str | None = None, log_interval: float = 0.0, hist_interval: float = 0.5) -> None:
+    # _read_bool 고속 경로: 합법 토큰 → 불리언 테이블. 정수/실수 키는
+    # 해시가 같아 numpy 스칼라(0/1)도 그대로 적중하고, 문자열은 대소문자
+    # 변형을 미리 담아 핫패스의 strip/upper 할당을 피한다.
+    _BOOL_MAP = {
+        0: False, 1: True, "0": False, "1": True, "": False,
+        "OFF": False, "ON": True, "CLOSE": False, "OPEN": True,
+        "FALSE": False, "TRUE": True, "NO": False, "YES": True,
+        "off": False, "on": True, "close": False, "open": True,
+        "false": False, "true": True, "no": False, "yes": True,
+    }
+
+    def __init__(self, dt: float, q_dcm: float, verbose: bool = False, init_config: str | None = None, log_interval: float = 0.0, hist_interval: float = 0.5, hist_tail: int = 0) -> None:
         # Initialize full CryoCooler simulator
         self.sim = CryoCoolerSim(
             SimState(T5=280.0, T6=280.0, PT1=1.0, PT3=1.0, LT19=40.0, LT23=30.0),
@@ -185,30 +219,39 @@ class PVBridge:
         self.alarm_t_high = 250.0
         self.log_interval = float(log_interval or 0.0)
         self._log_elapsed = 0.0
-        # History publish throttling
-        self.hist_interval = float(hist_interval or 0.5)
+        # History publish throttling. 0이면 링 기록과 게시를 모두 건너뛴다
+        # (트렌드 소비자가 없는 구동에서 히스토리 파이프라인 비용 제거).
+        self.hist_interval = float(hist_interval or 0.0)
+        self.hist_enabled = self.hist_interval > 0.0
         self._hist_elapsed = 0.0
-        # Last-put cache and eps map to reduce CA traffic
-        self._last_put: dict[str, float | int | str] = {}
-        self._eps_map: dict[str, float] = {
-            PV_T5: 0.05,
-            PV_T6: 0.05,
-            PV_PT1: 0.01,
-            PV_PT3: 0.01,
-            PV_FT18: 0.05,
-            PV_LT19: 0.05,
-            PV_LT23: 0.05,
-            PV_V17_POS: 0.5,
-            PV_FLOW_V17: 0.1,
-            PV_FLOW_V10: 0.1,
-            PV_PUMP_FREQ: 0.5,
-            PV_HEAT_POWER: 0.5,
-        }
+        # 게시 파형 길이 상한(최근 N 샘플). 0이면 전체 링을 게시한다.
+        # 모든 채널이 같은 꼬리를 잘라내므로 시간축 정렬은 유지된다.
+        self.hist_tail = max(0, int(hist_tail or 0))
+        # Monitor-fed value cache: CA callbacks (producer) deposit the latest
+        # value per pvname; the step loop (consumer) reads plain dict entries
+        # instead of issuing synchronous pv.get() round-trips every dt.
+        self._cache: dict[str, object] = {}
+        # CA 콜백(프로듀서 쓰레드) → 루프(컨슈머) 유계 이벤트 큐.
+        # 콜백은 append만 하고 캐시 갱신은 루프가 드레인하며 수행하므로
+        # 캐시는 단일 쓰레드 쓰기이고, 시뮬레이터가 지연돼도 메모리가
+        # maxlen 이상 자라지 않는다(오래된 이벤트부터 폐기).
+        self._evt_queue: deque = deque(maxlen=64)
+        # 비연결 PV 집합: 연결 콜백이 갱신하고, _write_* 핫패스는
+        # getattr/try 대신 멤버십 1회로 건너뛸지 판별한다.
+        self._disconnected: set[PV] = set()
+        # Last-put cache and eps map to reduce CA traffic.
+        # 키는 PV 객체 자체(아이덴티티 해시): 긴 PV 이름 문자열 해시와
+        # getattr(pv, 'pvname') 탐색을 쓰기 핫패스에서 제거한다.
+        self._last_put: dict[PV, float | int | str] = {}
+        self._eps_map: dict[PV, float] = {}
         # Internal time accumulator
         self._sim_time: float = 0.0
         # Event tracing helpers (AUTO/Stage changes)
         self._last_auto_name: str | None = None
         self._last_stage: int | None = None
+        # 로그 타임스탬프('HH:MM') 캐시: 분이 바뀔 때만 strftime을 수행
+        self._stamp_minute: int = -1
+        self._stamp_str: str = ""
         # Live-tuning PVs removed; runtime tuning via code only.
 
         # EPICS PVs
@@ -218,7 +261,7 @@ class PVBridge:
         self.pv_tsp = PV(PV_TSP, auto_monitor=True)
         self.pv_t5 = PV(PV_T5, auto_monitor=False)
         self.pv_t6 = PV(PV_T6, auto_monitor=False)
-        self.pv_tsub = PV(PV_TSUB, auto_monitor=True)
+        self.pv_tsub = PV(PV_TSUB, auto_monitor=False)
         self.pv_state_text = PV(PV_STATE_TEXT, auto_monitor=False)
         self.pv_comp_run = PV(PV_COMP_RUN, auto_monitor=False)
         self.pv_comp_status = PV(PV_COMP_STATUS, auto_monitor=False)
@@ -255,10 +298,10 @@ class PVBridge:
         self.pv_pt3 = PV(PV_PT3, auto_monitor=False)
         self.pv_pt3_sp = PV(PV_PT3_SP, auto_monitor=True)
         self.pv_ft18 = PV(PV_FT18, auto_monitor=False)
-        self.pv_v17_pos = PV(PV_V17_POS, auto_monitor=True)
+        self.pv_v17_pos = PV(PV_V17_POS, auto_monitor=False)
         self.pv_flow_v17 = PV(PV_FLOW_V17, auto_monitor=False)
         self.pv_flow_v10 = PV(PV_FLOW_V10, auto_monitor=False)
-        self.pv_dcm_power = PV(PV_DCM_POWER, auto_monitor=False)
+        self.pv_dcm_power = PV(PV_DCM_POWER, auto_monitor=True)
         # Historical arrays (waveforms)
         self.pv_hist_time = PV(PV_HIST_TIME, auto_monitor=False)
         self.pv_hist_t5 = PV(PV_HIST_T5, auto_monitor=False)
@@ -272,6 +315,47 @@ class PVBridge:
         self.pv_hist_lt23 = PV(PV_HIST_LT23, auto_monitor=False)
         self.pv_hist_pump_freq = PV(PV_HIST_PUMP_FREQ, auto_monitor=False)
 
+        # 아날로그 출력의 데드밴드(_write_float): 이 이하의 변화는 게시 생략
+        self._eps_map = {
+            self.pv_t5: 0.05,
+            self.pv_t6: 0.05,
+            self.pv_pt1: 0.01,
+            self.pv_pt3: 0.01,
+            self.pv_ft18: 0.05,
+            self.pv_lt19: 0.05,
+            self.pv_lt23: 0.05,
+            self.pv_v17_pos: 0.5,
+            self.pv_flow_v17: 0.1,
+            self.pv_flow_v10: 0.1,
+            self.pv_pump_freq: 0.5,
+            self.pv_heat_power: 0.5,
+        }
+
+        # 밸브 상태 미러: 비트 위치 ↔ STATUS PV 매핑(_mirror_status_from_sim)
+        self._valve_status_pvs = (
+            self.pv_v9_status, self.pv_v11_status, self.pv_v15_status,
+            self.pv_v17_status, self.pv_v19_status, self.pv_v20_status,
+            self.pv_v10_status, self.pv_v21_status,
+        )
+        # CMD PV 테이블(비트 순서는 STATUS와 동일): 수동모드 동기화가
+        # 미러와 같은 비트마스크를 공유해 밸브당 개별 분기를 없앤다.
+        self._valve_cmd_pvs = (
+            self.pv_v9_cmd, self.pv_v11_cmd, self.pv_v15_cmd,
+            self.pv_v17_cmd, self.pv_v19_cmd, self.pv_v20_cmd,
+            self.pv_v10_cmd, self.pv_v21_cmd,
+        )
+        self._last_valve_bits: int | None = None
+
+        # 입력 방향 PV는 모니터 콜백으로 캐시를 채운다(루프에서 get() 금지)
+        for pv in (
+            self.pv_tsp, self.pv_cmd, self.pv_mode, self.pv_pt3_sp,
+            self.pv_lt19, self.pv_lt23, self.pv_dcm_power,
+            self.pv_v9_cmd, self.pv_v11_cmd, self.pv_v15_cmd, self.pv_v17_cmd,
+            self.pv_v19_cmd, self.pv_v20_cmd, self.pv_v10_cmd, self.pv_v21_cmd,
+            self.pv_pump_cmd, self.pv_heat_cmd,
+        ):
+            pv.add_callback(self._on_pv_change)
+
         # Local state
         self.state: int = OperState.OFF.value
         self._last_cmd_val: int = 0
@@ -280,22 +364,25 @@ class PVBridge:
         self._last_nonzero_mode: int = 0
         self._held: bool = False
         # 브리지 상태 보조값은 불필요
-        # History buffers (seconds window ~ maxlen * dt)
+        # History ring buffer (seconds window ~ hist_len * dt)
+        # 단일 2-D 배열(SoA)에 채널별 행을 두고 정수 커서로 순환 기록한다.
+        # deque 블록 재할당과 게시 시 np.asarray 복사를 모두 제거한다.
         self.hist_len = min(2048, max(120, int(600.0 / self.dt)))
-        self.hist_time = deque(maxlen=self.hist_len)
-        self.hist_t5 = deque(maxlen=self.hist_len)
-        self.hist_t6 = deque(maxlen=self.hist_len)
-        self.hist_pt1 = deque(maxlen=self.hist_len)
-        self.hist_pt3 = deque(maxlen=self.hist_len)
-        self.hist_ft18 = deque(maxlen=self.hist_len)
-        self.hist_lt19 = deque(maxlen=self.hist_len)
-        self.hist_lt23 = deque(maxlen=self.hist_len)
-        self.hist_flow_v17 = deque(maxlen=self.hist_len)
-        self.hist_flow_v10 = deque(maxlen=self.hist_len)
-        self.hist_pump_freq = deque(maxlen=self.hist_len)
+        # float32면 온도/압력 텔레메트리 분해능(~0.01K/0.001bar)에 충분하며
+        # 파형 전송량과 IOC 버퍼가 절반이 된다(레코드 FTVL=FLOAT과 일치).
+        self._hist = np.empty((len(HIST_ROWS), self.hist_len), dtype=np.float32)
+        self._hist_idx = 0  # next write position
+        self._hist_n = 0    # valid sample count (<= hist_len)
+        self._hist_t_last = 0.0  # sim time of the newest sample
+        # 게시용 재사용 버퍼: pv.put은 호출 시점에 CA 버퍼로 복사하므로
+        # 채널 간 공유해도 안전하다. 랩어라운드 이후의 재배열과 시간축
+        # 생성에서 매 게시마다의 새 배열 할당을 없앤다.
+        self._hist_out = np.empty(self.hist_len, dtype=np.float32)
+        self._hist_time_out = np.empty(self.hist_len, dtype=np.float32)
+        self._hist_tgrid = (np.arange(self.hist_len) * self.dt).astype(np.float32)
 
         # Verify connections
-        conns = [
+        conns = (
             (PV_STATE, self.pv_state),
             (PV_CMD, self.pv_cmd),
             (PV_MODE, self.pv_mode),
@@ -335,6 +422,9 @@ class PVBridge:
             (PV_SAFETY_ILK, self.pv_safety_ilk),
             (PV_READY, self.pv_ready),
             (PV_PT3_SP, self.pv_pt3_sp),
+            (PV_PT1, self.pv_pt1),
+            (PV_PT3, self.pv_pt3),
+            (PV_FT18, self.pv_ft18),
             (PV_HIST_TIME, self.pv_hist_time),
             (PV_HIST_T5, self.pv_hist_t5),
             (PV_HIST_T6, self.pv_hist_t6),
@@ -344,11 +434,24 @@ class PVBridge:
             (PV_FLOW_V17, self.pv_flow_v17),
             (PV_FLOW_V10, self.pv_flow_v10),
             (PV_DCM_POWER, self.pv_dcm_power),
-        ]
+        )
+        # 채널 탐색은 PV 생성 시점에 이미 병렬로 시작되었으므로, 전체에
+        # 대해 하나의 데드라인만 공유하면 기동 대기가 O(N·timeout)이 아닌
+        # O(timeout)으로 끝난다.
         failed = []
+        deadline = time.perf_counter() + 1.0
         for name, obj in conns:
-            if not obj.wait_for_connection(timeout=1.0):
+            remaining = max(0.0, deadline - time.perf_counter())
+            if not obj.wait_for_connection(timeout=remaining):
                 failed.append(name)
+        # 연결 상태 추적 콜백 등록 + 현재 상태로 비연결 집합 시드
+        for _pv in tuple(obj for _n, obj in conns) + (
+            self.pv_hist_ft18, self.pv_hist_flow_v17, self.pv_hist_flow_v10,
+            self.pv_hist_lt19, self.pv_hist_lt23, self.pv_hist_pump_freq,
+        ):
+            _pv.connection_callbacks.append(self._on_conn_change)
+            if not _pv.connected:
+                self._disconnected.add(_pv)
         if self.verbose:
             print(f"[pv_bridge] connected={len(conns)-len(failed)}/{len(conns)}")
             if failed:
@@ -356,15 +459,50 @@ class PVBridge:
         if failed:
             # We continue, but warn that some PVs are missing
             pass
-        # Seed internal sim time from PV if available
-        try:
-            tv = self.pv_time.get(timeout=0.2)
-            self._sim_time = float(tv) if tv is not None else 0.0
-        except Exception:
-            self._sim_time = 0.0
+        # Internal sim time is bridge-local; pv_time is write-only output
+        # (no startup get against an output PV).
+
+    def _on_conn_change(self, pvname: str | None = None, conn: bool = False, pv: PV | None = None, **kws) -> None:
+        """연결 콜백: 쓰기 경로가 참조하는 비연결 집합을 갱신한다."""
+        if pv is None:
+            return
+        if conn:
+            self._disconnected.discard(pv)
+            # 재연결 시 중복 게시 캐시를 무효화한다: IOC 재기동으로 레코드가
+            # 초기화됐을 수 있으므로 마지막 송신값 기준의 생략은 위험하다.
+            self._last_put.pop(pv, None)
+            # 상태 PV가 재연결되면 미러 마스크도 무효화해 다음 틱에 8비트
+            # 전체를 재게시한다(비연결 동안 기록만 되고 못 쓴 비트 복구).
+            if pv in self._valve_status_pvs:
+                self._last_valve_bits = None
+        else:
+            self._disconnected.add(pv)
+
+    def _on_pv_change(self, pvname: str | None = None, value=None, **kws) -> None:
+        """CA monitor callback: enqueue the update for loop-side consumption."""
+        if pvname is not None:
+            self._evt_queue.append((pvname, value))
+
+    def _drain_events(self) -> None:
+        """큐에 쌓인 모니터 이벤트를 캐시에 반영한다(틱 선두에서 호출)."""
+        q = self._evt_queue
+        cache = self._cache
+        while q:
+            name, value = q.popleft()
+            cache[name] = value
+
+    def _cached(self, pv: PV):
+        """모니터 캐시 우선 판독. 첫 갱신 전에는 1회 get으로 시드한다."""
+        name = pv.pvname
+        v = self._cache.get(name)
+        if v is None:
+            v = pv.get(timeout=0.2)
+            if v is not None:
+                self._cache[name] = v
+        return v
 
     def _read(self, pv: PV, default: float) -> float:
-        v = pv.get(timeout=0.2)
+        v = self._cached(pv)
         return float(v) if v is not None else float(default)
 
     def _read_bool(self, pv: PV, default: bool = False) -> bool:
@@ -373,17 +511,23 @@ class PVBridge:
         Accepts numeric 0/1, numpy scalars, or enum strings like 'OPEN'/'CLOSE', 'ON'/'OFF'.
         """
         try:
-            v = pv.get(timeout=0.2)
+            v = self._cached(pv)
         except Exception:
             return bool(default)
         if v is None:
             return bool(default)
-        # Numeric-like
+        # Fast path: direct table lookup (no branches, no string allocation)
+        try:
+            m = self._BOOL_MAP.get(v)
+        except TypeError:  # unhashable (e.g. array-valued PV)
+            m = None
+        if m is not None:
+            return m
+        # Slow path for values outside the table
         try:
             return int(v) != 0  # handles numpy scalars too
         except Exception:
             pass
-        # String-like
         try:
             s = str(v).strip().upper()
             if s in ("", "0", "OFF", "CLOSE", "FALSE", "NO"):
@@ -402,35 +546,43 @@ class PVBridge:
             return False
 
     def _write_int(self, pv: PV, val: int) -> None:
-        name = getattr(pv, 'pvname', str(pv))
-        if not self._is_pv_connected(pv):
+        if pv in self._disconnected:
             return
-        last = self._last_put.get(name)
+        last = self._last_put.get(pv)
         if isinstance(last, (int, float)) and int(last) == int(val):
             return
-        pv.put(int(val), wait=False)
-        self._last_put[name] = int(val)
+        # 스칼라 핫패스는 pv.put 래퍼(타입 판별/완료 콜백 준비)를 건너뛰고
+        # 채널 핸들에 직접 기록한다. 문자열/파형은 계속 pv.put을 쓴다.
+        ca.put(pv.chid, int(val), wait=False)
+        self._last_put[pv] = int(val)
 
     def _write_float(self, pv: PV, val: float) -> None:
-        name = getattr(pv, 'pvname', str(pv))
-        if not self._is_pv_connected(pv):
+        if pv in self._disconnected:
             return
-        eps = self._eps_map.get(name, 0.0)
-        last = self._last_put.get(name)
+        eps = self._eps_map.get(pv, 0.0)
+        last = self._last_put.get(pv)
         if isinstance(last, (int, float)) and abs(float(last) - float(val)) <= eps:
             return
-        pv.put(float(val), wait=False)
-        self._last_put[name] = float(val)
+        ca.put(pv.chid, float(val), wait=False)
+        self._last_put[pv] = float(val)
 
     def _write_str(self, pv: PV, s: str) -> None:
-        name = getattr(pv, 'pvname', str(pv))
-        if not self._is_pv_connected(pv):
+        if pv in self._disconnected:
             return
-        last = self._last_put.get(name)
+        last = self._last_put.get(pv)
         if isinstance(last, str) and last == s:
             return
         pv.put(s, wait=False)
-        self._last_put[name] = s
+        self._last_put[pv] = s
+
+    def _minute_stamp(self) -> str:
+        """로그용 'HH:MM' 문자열. 분이 바뀔 때만 포맷을 다시 계산한다."""
+        now = time.time()
+        minute = int(now // 60)
+        if minute != self._stamp_minute:
+            self._stamp_minute = minute
+            self._stamp_str = time.strftime('%H:%M', time.localtime(now))
+        return self._stamp_str
 
     def _state_name(self, s: Optional[int] = None) -> str:
         if s is None:
@@ -456,21 +608,32 @@ class PVBridge:
         except Exception:
             pass
 
-        self._write_int(self.pv_state, self.state)
-        self._write_str(self.pv_state_text, self._state_name())
-        self._write_float(self.pv_t5, self.sim.state.T5)
-        self._write_float(self.pv_t6, self.sim.state.T6)
+        # 기동 시 초기값은 caput_many로 일괄 기록한다(순차 put N회 대신
+        # 1회 배치). _last_put을 같이 시드해 루프 첫 틱의 중복 put을 막는다.
+        init_names = [PV_STATE, PV_STATE_TEXT, PV_T5, PV_T6]
+        init_vals: list = [
+            int(self.state),
+            self._state_name(),
+            float(self.sim.state.T5),
+            float(self.sim.state.T6),
+        ]
+        try:
+            caput_many(init_names, init_vals, wait=False, connection_timeout=1.0)
+            init_pvs = (self.pv_state, self.pv_state_text, self.pv_t5, self.pv_t6)
+            self._last_put.update(zip(init_pvs, init_vals))
+        except Exception:
+            self._write_int(self.pv_state, self.state)
+            self._write_str(self.pv_state_text, self._state_name())
+            self._write_float(self.pv_t5, self.sim.state.T5)
+            self._write_float(self.pv_t6, self.sim.state.T6)
         # initialize internal sim time only; pv_time will be published with history
         if self._sim_time <= 0.0:
             self._sim_time = 0.0
 
         # Subcooler 초기값은 pv_init.yaml로부터만 시드됨
         # LT19/LT23는 IOC 현재값을 신뢰하여 시뮬레이터 상태에 반영한다(초기 시드 동기화).
-        try:
-            self.sim.state.LT19 = float(self._read(self.pv_lt19, self.sim.state.LT19))
-            self.sim.state.LT23 = float(self._read(self.pv_lt23, self.sim.state.LT23))
-        except Exception:
-            pass
+        self.sim.state.LT19 = self._read(self.pv_lt19, self.sim.state.LT19)
+        self.sim.state.LT23 = self._read(self.pv_lt23, self.sim.state.LT23)
         # alarm/ilk 초기값은 로직에 의해 계산됨
         # 초기 장치/보조 상태는 YAML 또는 시퀀서 스냅샷에 의해 동기화됨
         # DCM power 초기값은 pv_init.yaml 또는 기존 PV 값을 사용
@@ -488,39 +651,40 @@ class PVBridge:
         self._apply_init_from_yaml()
         # Live-tuning PV initialization removed
         # YAML이 PV를 갱신했을 수 있으므로 다시 동기화
-        try:
-            self.sim.state.LT19 = float(self._read(self.pv_lt19, self.sim.state.LT19))
-            self.sim.state.LT23 = float(self._read(self.pv_lt23, self.sim.state.LT23))
-        except Exception:
-            pass
+        self.sim.state.LT19 = self._read(self.pv_lt19, self.sim.state.LT19)
+        self.sim.state.LT23 = self._read(self.pv_lt23, self.sim.state.LT23)
 
         # Seed history with first sample
-        self.hist_time.clear()
-        self.hist_t5.clear()
-        self.hist_t6.clear()
-        self.hist_pt1.clear()
-        self.hist_pt3.clear()
-        self.hist_time.append(0.0)
-        self.hist_t5.append(self.sim.state.T5)
-        self.hist_t6.append(self.sim.state.T6)
-        self.hist_pt1.append(1.0)
-        self.hist_pt3.append(1.0)
-        self.hist_ft18.append(0.0)
-        self.hist_lt19.append(0.0)
-        self.hist_lt23.append(0.0)
-        self.hist_flow_v17.append(0.0)
-        self.hist_flow_v10.append(0.0)
-        self.hist_pump_freq.append(0.0)
-        self._publish_history()
+        if self.hist_enabled:
+            self._hist_reset()
+            self._hist_append(0.0, (
+                self.sim.state.T5, self.sim.state.T6, 1.0, 1.0,
+                0.0, 0.0, 0.0, 0.0, 0.0, 0.0,
+            ))
+            self._publish_history()
 
         if self.verbose:
             print(f"[pv_bridge] loop start dt={self.dt} q_dcm={self.q_dcm}")
         # Use monotonic timing so processing time doesn't add to the period
+        # 핫루프 전 프리바인딩: self.sim.* 체인 탐색을 틱마다 반복하지 않는다.
+        sim_step = self.sim.step
+        write_int = self._write_int
+        write_float = self._write_float
+        write_str = self._write_str
+        sim_state = self.sim.state
+        ambK = self.sim.ambK  # 클래스 상수(주변 온도)
+        # 스냅샷은 틱당 1회만 생성한다. PT3 설정값 기본치는 직전 틱
+        # 스냅샷을 재사용하므로 선행 시드가 필요하다.
+        try:
+            snap = self.seq.snapshot_status() if self.seq is not None else {}
+        except Exception:
+            snap = {}
         next_tick = time.perf_counter()
         while True:
+            self._drain_events()
             tsp = self._read(self.pv_tsp, default=tsp)
             # Live-tuning PV application removed
-            mode_val = int(self.pv_mode.get() or 0)
+            mode_val = int(self._read(self.pv_mode, 0))
             # 최근 유효 모드(latched) 갱신 및 OperatingLogic에 반영 (0은 무시하여 래칭 유지)
             mode_changed = (mode_val != self._last_mode_val)
             if mode_val != 0:
@@ -530,7 +694,7 @@ class PVBridge:
                         self.oper_logic.set_mode(mode_val)
                     except Exception:
                         pass
-            cmd_val = int(self.pv_cmd.get() or 0)
+            cmd_val = int(self._read(self.pv_cmd, 0))
             cmd_changed = (cmd_val != self._last_cmd_val)
             # START/STOP 등 MainCmd 변화시에만 시퀀스 액션 호출
             eff_mode_val = (self.oper_logic.mode if getattr(self, 'oper_logic', None) is not None else 0) or (self._last_nonzero_mode or 0)
@@ -581,15 +745,13 @@ class PVBridge:
                     if self.verbose:
                         print(f"[pv_bridge] operating.plan_action error: {e}")
                 # Update hold flag from command
-                if cmd_val == MainCmd.HOLD.value:
+                if cmd_val == _CMD_HOLD:
                     self._held = True
-                elif cmd_val in (
-                    MainCmd.RESUME.value, MainCmd.START.value, MainCmd.STOP.value, MainCmd.OFF.value, MainCmd.RESET.value
-                ):
+                elif cmd_val in _UNHOLD_CMDS:
                     self._held = False
                 # STOP/OFF 직후 수동모드로 전환: 현재 강제 상태를 PV CMD에 반영해 동기화
                 try:
-                    if cmd_val in (MainCmd.STOP.value, MainCmd.OFF.value):
+                    if cmd_val in _STOP_OFF_CMDS:
                         self._sync_manual_cmd_pvs_from_sim()
                 except Exception:
                     pass
@@ -601,12 +763,9 @@ class PVBridge:
             # Apply PT3 setpoint from PV
             try:
                 if self.seq is not None:
-                    cur = 0.0
-                    try:
-                        cur = float(self.seq.snapshot_status().get('press_sp_bar', 0.0))
-                    except Exception:
-                        cur = 0.0
-                    self.seq.set_press_sp(float(self._read(self.pv_pt3_sp, default=cur)))
+                    # 기본값은 직전 틱 스냅샷의 press_sp_bar(추가 스냅샷 호출 없음)
+                    cur = float(snap.get('press_sp_bar', 0.0))
+                    self.seq.set_press_sp(self._read(self.pv_pt3_sp, default=cur))
             except Exception:
                 pass
             # Update sequencer (operating controller) before physics
@@ -615,42 +774,50 @@ class PVBridge:
                     self.seq.update(self.dt)
             except Exception:
                 pass
-            self.sim.step(self.dt, power_W=self.q_dcm)
-            self._write_float(self.pv_t5, self.sim.state.T5)
-            self._write_float(self.pv_t6, self.sim.state.T6)
-            self._write_float(self.pv_pt1, self.sim.state.PT1)
-            self._write_float(self.pv_pt3, self.sim.state.PT3)
-            self._write_float(self.pv_ft18, self.sim.state.FT18)
+            sim_step(self.dt, power_W=self.q_dcm)
+            write_float(self.pv_t5, sim_state.T5)
+            write_float(self.pv_t6, sim_state.T6)
+            write_float(self.pv_pt1, sim_state.PT1)
+            write_float(self.pv_pt3, sim_state.PT3)
+            write_float(self.pv_ft18, sim_state.FT18)
             # advance internal time accumulator; write to PV on throttled history publish
             self._sim_time += self.dt
             # Publish levels to PVs so HMI (caget) reflects simulator state
-            self._write_float(self.pv_lt19, self.sim.state.LT19)
-            self._write_float(self.pv_lt23, self.sim.state.LT23)
+            write_float(self.pv_lt19, sim_state.LT19)
+            write_float(self.pv_lt23, sim_state.LT23)
             # Pre-compute derived flows before history append
             # (fix: ensure flow_v17/flow_v10 are defined before use)
             snap = self.seq.snapshot_status() if self.seq is not None else {}
-            v17_pos = float(snap.get('V17', 0.0)) * 100.0
+            # 이벤트/트레이스 로그가 함께 쓰는 시퀀서 파생값을 틱당 1회 계산
+            seq_auto = getattr(self.seq, 'auto', None)
+            cur_auto_name = seq_auto.name if seq_auto is not None else 'NA'
+            cur_stage = int(getattr(self.seq, 'stage', -1))
+            pump_hz = float(snap.get('pump_hz', 0.0))
+            v17_pos = snap.get('V17', 0.0) * 100.0
             flow_v17 = 0.08 * v17_pos
-            flow_v10 = 6.0 if int(float(snap.get('V10', 0.0)) > 0.5) else 0.0
-
-            # Update history arrays
-            tnext = (self.hist_time[-1] if self.hist_time else 0.0) + self.dt
-            self.hist_time.append(tnext)
-            self.hist_t5.append(self.sim.state.T5)
-            self.hist_t6.append(self.sim.state.T6)
-            self.hist_pt1.append(self.sim.state.PT1)
-            self.hist_pt3.append(self.sim.state.PT3)
-            self.hist_ft18.append(self.sim.state.FT18)
-            self.hist_lt19.append(self.sim.state.LT19)
-            self.hist_lt23.append(self.sim.state.LT23)
-            self.hist_flow_v17.append(flow_v17)
-            self.hist_flow_v10.append(flow_v10)
-            self.hist_pump_freq.append(float(snap.get('pump_hz', 0.0)))
-            # Throttle history waveform publishing to reduce CA load
-            self._hist_elapsed += self.dt
-            if self._hist_elapsed >= self.hist_interval:
-                self._hist_elapsed = 0.0
-                self._publish_history()
+            flow_v10 = 6.0 if snap.get('V10', 0.0) > 0.5 else 0.0
+
+            # Update history arrays (비활성화 시 기록 자체를 생략)
+            if self.hist_enabled:
+                tnext = self._hist_last_time() + self.dt
+                self._hist_append(tnext, (
+                    sim_state.T5,
+                    sim_state.T6,
+                    sim_state.PT1,
+                    sim_state.PT3,
+                    sim_state.FT18,
+                    sim_state.LT19,
+                    sim_state.LT23,
+                    flow_v17,
+                    flow_v10,
+                    pump_hz,
+                ))
+                # Throttle history waveform publishing to reduce CA load
+                self._hist_elapsed += self.dt
+                if self._hist_elapsed >= self.hist_interval:
+                    # 잔여분을 이월해 게시 주기가 누적 지연되지 않도록 한다
+                    self._hist_elapsed -= self.hist_interval
+                    self._publish_history()
             # State transition managed by OperatingLogic
             try:
                 if self.oper_logic is not None:
@@ -658,71 +825,62 @@ class PVBridge:
                     cmd_for_transition = cmd_val if cmd_changed else 0
                     new_state = self.oper_logic.next_state(
                         state=self.state,
-                        STATE=STATE,
                         cmd_val=cmd_for_transition,
                         mode_val=eff_mode_val,
                         tsp=tsp,
-                        t5=self.sim.state.T5,
-                        tamb=getattr(self.sim, 'ambK', 280.0),
+                        t5=sim_state.T5,
+                        tamb=ambK,
                         dt=self.dt,
                     )
                     # READY override: 시퀀서/시뮬레이터가 READY이면 GUI 상태를 READY로 표시
-                    try:
-                        if bool(getattr(self.sim.state, 'ready', False)):
-                            new_state = OperState.READY.value
-                    except Exception:
-                        pass
+                    if sim_state.ready:
+                        new_state = OperState.READY.value
                     if int(new_state) != int(self.state):
                         self.state = int(new_state)
-                        self._write_int(self.pv_state, self.state)
-                        self._write_str(self.pv_state_text, self._state_name())
+                        write_int(self.pv_state, self.state)
+                        write_str(self.pv_state_text, self._state_name())
                 else:
                     # Fallback: keep state as-is
                     pass
             except Exception as e:
                 if self.verbose:
                     print(f"[pv_bridge] operating.next_state error: {e}")
-            comp_on = 1 if (float(snap.get('pump_hz', 0.0)) > 0.0 or bool(snap.get('press_ctrl_on', False))) else 0
-            self._write_int(self.pv_comp_run, comp_on)
-            self._write_str(self.pv_comp_status, "RUNNING" if comp_on else "OFF")
+            comp_on = 1 if (pump_hz > 0.0 or snap.get('press_ctrl_on')) else 0
+            write_int(self.pv_comp_run, comp_on)
+            write_str(self.pv_comp_status, "RUNNING" if comp_on else "OFF")
 
             # One-shot event logs when AUTO or STAGE changes
-            try:
-                cur_auto_name = getattr(self.seq, 'auto', None).name if getattr(self, 'seq', None) is not None else 'NA'
-                cur_stage = int(getattr(self.seq, 'stage', -1))
+            # (비교/기록 자체가 verbose 전용이므로 비활성 시 전부 생략)
+            if self.verbose:
                 if (cur_auto_name != self._last_auto_name) or (cur_stage != self._last_stage):
                     self._last_auto_name = cur_auto_name
                     self._last_stage = cur_stage
-                    if self.verbose:
-                        #ts2 = datetime.now().strftime('%H:%M:%S.%f')[:-3]
-                        ts2 = datetime.now().strftime('%H:%M')
+                    ts2 = self._minute_stamp()
+                    try:
                         print(
                             "[event]",
                             ts2,
                             f"AUTO={cur_auto_name}",
                             f"STAGE={cur_stage}",
-                            #f"T6={self.sim.state.T6:.1f}K",
-                            #f"PT1={self.sim.state.PT1:.2f}bar",
-                            #f"PT3={self.sim.state.PT3:.2f}bar",
+                            #f"T6={sim_state.T6:.1f}K",
+                            #f"PT1={sim_state.PT1:.2f}bar",
+                            #f"PT3={sim_state.PT3:.2f}bar",
                         )
-            except Exception:
-                pass
+                    except Exception:
+                        pass
 
             # Publish READY boolean for GUI LED
-            try:
-                self._write_int(self.pv_ready, 1 if bool(getattr(self.sim.state, 'ready', False)) else 0)
-            except Exception:
-                pass
+            write_int(self.pv_ready, 1 if sim_state.ready else 0)
 
             # Mirror valve statuses from commands
-            self._mirror_status_from_sim()
-            self._write_float(self.pv_v17_pos, v17_pos)
-            self._write_float(self.pv_flow_v17, flow_v17)
-            self._write_float(self.pv_flow_v10, flow_v10)
-            self._write_int(self.pv_pump_run, 1 if float(snap.get('pump_hz', 0.0)) > 0.0 else 0)
-            self._write_float(self.pv_pump_freq, float(snap.get('pump_hz', 0.0)))
-            self._write_int(self.pv_heat_run, 1 if bool(snap.get('press_ctrl_on', False)) else 0)
-            self._write_float(self.pv_heat_power, float(snap.get('heater_u', 0.0)) * 100.0)
+            self._mirror_status_from_sim(snap)
+            write_float(self.pv_v17_pos, v17_pos)
+            write_float(self.pv_flow_v17, flow_v17)
+            write_float(self.pv_flow_v10, flow_v10)
+            write_int(self.pv_pump_run, 1 if pump_hz > 0.0 else 0)
+            write_float(self.pv_pump_freq, pump_hz)
+            write_int(self.pv_heat_run, 1 if bool(snap.get('press_ctrl_on', False)) else 0)
+            write_float(self.pv_heat_power, float(snap.get('heater_u', 0.0)) * 100.0)
 
             # Interlock evaluation (if configured), else fallback simple rule
             if self.ilk_logic is not None:
@@ -731,18 +889,15 @@ class PVBridge:
                         "tch": float('nan'),
                         "lt19": float(self._read(self.pv_lt19, 50.0)),
                         "lt23": float(self._read(self.pv_lt23, 70.0)),
-                        "ft18": float(self.sim.state.FT18),
+                        "ft18": float(sim_state.FT18),
                     }
                 )
-                self._write_int(self.pv_alarm_max, int(sev))
-                self._write_int(self.pv_safety_ilk, 1 if safe else 0)
+                write_int(self.pv_alarm_max, int(sev))
+                write_int(self.pv_safety_ilk, 1 if safe else 0)
             else:
-                self._write_int(self.pv_alarm_max, 1 if self.sim.state.T6 > float(self.alarm_t_high) else 0)
+                write_int(self.pv_alarm_max, 1 if sim_state.T6 > float(self.alarm_t_high) else 0)
             # Read DCM power from PV as input (operator-set heat load)
-            try:
-                self.q_dcm = float(self._read(self.pv_dcm_power, default=self.q_dcm))
-            except Exception:
-                pass
+            self.q_dcm = self._read(self.pv_dcm_power, default=self.q_dcm)
 
             # 주기 로그(모드/메인 명령 및 핵심 상태) 출력
             if self.log_interval > 0.0:
@@ -750,7 +905,7 @@ class PVBridge:
                 if self._log_elapsed >= self.log_interval:
                     self._log_elapsed = 0.0
                     try:
-                        ts = datetime.now().strftime('%H:%M')
+                        ts = self._minute_stamp()
                     except Exception:
                         ts = f"t={self._sim_time:.1f}s"
                     try:
@@ -761,21 +916,25 @@ class PVBridge:
                             f"MODE={int(mode_val)}",
                             f"effMODE={int(eff_mode_val)}",
                             f"STATE={self._state_name()}",
-                            f"AUTO={getattr(self.seq, 'auto', None).name if getattr(self, 'seq', None) is not None else 'NA'}",
-                            f"STAGE={int(getattr(self.seq, 'stage', -1))}",
+                            f"AUTO={cur_auto_name}",
+                            f"STAGE={cur_stage}",
                             #f"V10={'OPEN' if (self.sim.controls.V10 > 0.5) else 'CLOSE'}",
                             #f"V17={'OPEN' if (self.sim.controls.V17 > 0.5) else 'CLOSE'}",
                             #f"V20={'OPEN' if (self.sim.controls.V20 > 0.5) else 'CLOSE'}",
                             #f"V15={'OPEN' if self.sim.controls.V15 else 'CLOSE'}",
                             #f"V19={'OPEN' if self.sim.controls.V19 else 'CLOSE'}",
-                            #f"LT23={self.sim.state.LT23:.1f}%",
-                            #f"LT19={self.sim.state.LT19:.1f}%",
+                            #f"LT23={sim_state.LT23:.1f}%",
+                            #f"LT19={sim_state.LT19:.1f}%",
                         )
                     except Exception:
                         pass
 
             # Done updating derived PVs (suppress per-iteration verbose prints)
 
+            # 틱당 1회만 CA 송신 버퍼를 비운다: 위의 put들은 wait=False로
+            # 큐잉만 하고, 여기서 묶어서 내보내 플러시 횟수를 줄인다.
+            ca.flush_io()
+
             # Maintain ~dt loop using monotonic clock
             next_tick += self.dt
             now = time.perf_counter()
@@ -789,59 +948,112 @@ class PVBridge:
                     except Exception:
                         pass
                 sleep_for = 0.0
-            time.sleep(sleep_for)
+            # 대기 중에도 CA 이벤트 루프가 돌도록 pend_event로 잔여 시간을 보낸다
+            # (모니터 콜백/송수신이 sleep과 겹쳐 처리됨)
+            if sleep_for > 0.0:
+                ca.pend_event(sleep_for)
+            else:
+                ca.poll()
+
+    # --- History ring buffer (rows follow HIST_ROWS) ---
+
+    def _hist_reset(self) -> None:
+        self._hist_idx = 0
+        self._hist_n = 0
+        self._hist_t_last = 0.0
+
+    def _hist_append(self, t: float, values) -> None:
+        """한 스텝 샘플(채널당 1값)을 순환 버퍼에 기록한다."""
+        self._hist_t_last = t
+        self._hist[:, self._hist_idx] = values
+        self._hist_idx = (self._hist_idx + 1) % self.hist_len
+        if self._hist_n < self.hist_len:
+            self._hist_n += 1
+
+    def _hist_last_time(self) -> float:
+        return self._hist_t_last
+
+    def _hist_channel(self, row: int) -> "np.ndarray":
+        """시간순으로 정렬된 채널 배열 뷰/복사본을 돌려준다.
+
+        랩어라운드 전에는 zero-copy 슬라이스, 랩어라운드 후에는 재사용
+        버퍼(_hist_out)로 복사해 게시당 새 배열 할당을 피한다.
+        """
+        data = self._hist[row]
+        if self._hist_n < self.hist_len:
+            return data[: self._hist_n]
+        idx = self._hist_idx
+        if idx == 0:
+            return data
+        out = self._hist_out
+        k = self.hist_len - idx
+        out[:k] = data[idx:]
+        out[k:] = data[:idx]
+        return out
 
     def _publish_history(self) -> None:
         try:
             # publish current time and waveforms together
             self._write_float(self.pv_time, self._sim_time)
             hist_targets = (
-                (self.pv_hist_time, self.hist_time),
-                (self.pv_hist_t5, self.hist_t5),
-                (self.pv_hist_t6, self.hist_t6),
-                (self.pv_hist_pt1, self.hist_pt1),
-                (self.pv_hist_pt3, self.hist_pt3),
-                (self.pv_hist_ft18, self.hist_ft18),
-                (self.pv_hist_lt19, self.hist_lt19),
-                (self.pv_hist_lt23, self.hist_lt23),
-                (self.pv_hist_flow_v17, self.hist_flow_v17),
-                (self.pv_hist_flow_v10, self.hist_flow_v10),
-                (self.pv_hist_pump_freq, self.hist_pump_freq),
+                self.pv_hist_t5,
+                self.pv_hist_t6,
+                self.pv_hist_pt1,
+                self.pv_hist_pt3,
+                self.pv_hist_ft18,
+                self.pv_hist_lt19,
+                self.pv_hist_lt23,
+                self.pv_hist_flow_v17,
+                self.pv_hist_flow_v10,
+                self.pv_hist_pump_freq,
             )
-            for pv, data in hist_targets:
+            tail = self.hist_tail
+            n = self._hist_n
+            if tail and n > tail:
+                n = tail
+            # 시간축은 등간격이므로 마지막 샘플 시각에서 역산해 게시한다
+            if n > 0 and self._is_pv_connected(self.pv_hist_time):
+                t0 = self._hist_t_last - self.dt * (n - 1)
+                taxis = self._hist_time_out[:n]
+                np.add(np.float32(t0), self._hist_tgrid[:n], out=taxis)
+                self.pv_hist_time.put(taxis, wait=False)
+            for row, pv in enumerate(hist_targets):
                 if not self._is_pv_connected(pv):
                     continue
-                pv.put(np.asarray(data, dtype=float), wait=False)
+                data = self._hist_channel(row)
+                if tail and data.shape[0] > tail:
+                    data = data[-tail:]
+                pv.put(data, wait=False)
         except Exception as e:
             if self.verbose:
                 print(f"[pv_bridge] history publish error: {e}")
 
     # Live-tuning helpers removed
 
+    @staticmethod
+    def _safe_load_yaml(path: Path) -> dict:
+        """선택적 YAML 파일을 파싱한다(없으면 빈 dict)."""
+        if not path.exists():
+            return {}
+        with open(path, "r", encoding="utf-8") as f:
+            return yaml.load(f, Loader=_YamlLoader) or {}
+
     def _load_operating_interlock(self) -> None:
         """Load optional operating/interlock YAMLs to configure external logic."""
         self.oper_logic = None
         self.ilk_logic = None
         try:
-            oper_path = _ROOT / "tools" / "operating.yaml"
-            data = {}
-            if oper_path.exists():
-                import yaml
-                with open(oper_path, "r", encoding="utf-8") as f:
-                    data = yaml.safe_load(f) or {}
             # 운영 로직은 선택적 사용
-            self.oper_logic = OperatingLogic.from_yaml(data)
+            self.oper_logic = OperatingLogic.from_yaml(
+                self._safe_load_yaml(_ROOT / "tools" / "operating.yaml")
+            )
         except Exception:
             # 실패 시에도 기본 파라미터로 생성
             self.oper_logic = OperatingLogic.from_yaml({})
         try:
             ilk_path = _ROOT / "tools" / "interlock.yaml"
             if ilk_path.exists():
-                import yaml
-
-                with open(ilk_path, "r", encoding="utf-8") as f:
-                    data = yaml.safe_load(f) or {}
-                self.ilk_logic = InterlockLogic.from_yaml(data)
+                self.ilk_logic = InterlockLogic.from_yaml(self._safe_load_yaml(ilk_path))
         except Exception:
             self.ilk_logic = None
 
@@ -858,17 +1070,19 @@ class PVBridge:
         try:
             if self.seq is None:
                 return
+            # 호출당 1회만 메서드를 바인딩(10회의 self._read_bool 탐색 제거)
+            read_bool = self._read_bool
             self.seq.apply_manual_commands(
-                v9=self._read_bool(self.pv_v9_cmd, False),
-                v11=self._read_bool(self.pv_v11_cmd, False),
-                v15=self._read_bool(self.pv_v15_cmd, False),
-                v19=self._read_bool(self.pv_v19_cmd, False),
-                v20=self._read_bool(self.pv_v20_cmd, False),
-                v17=self._read_bool(self.pv_v17_cmd, False),
-                v10=self._read_bool(self.pv_v10_cmd, False),
-                v21=self._read_bool(self.pv_v21_cmd, False),
-                pump=self._read_bool(self.pv_pump_cmd, False),
-                heat=self._read_bool(self.pv_heat_cmd, False),
+                v9=read_bool(self.pv_v9_cmd, False),
+                v11=read_bool(self.pv_v11_cmd, False),
+                v15=read_bool(self.pv_v15_cmd, False),
+                v19=read_bool(self.pv_v19_cmd, False),
+                v20=read_bool(self.pv_v20_cmd, False),
+                v17=read_bool(self.pv_v17_cmd, False),
+                v10=read_bool(self.pv_v10_cmd, False),
+                v21=read_bool(self.pv_v21_cmd, False),
+                pump=read_bool(self.pv_pump_cmd, False),
+                heat=read_bool(self.pv_heat_cmd, False),
             )
         except Exception:
             pass
@@ -881,56 +1095,51 @@ class PVBridge:
         """
         try:
             snap = self.seq.snapshot_status() if self.seq is not None else {}
-            self._write_int(self.pv_v9_cmd, 1 if bool(snap.get('V9', False)) else 0)
-        except Exception:
-            pass
-        try:
-            self._write_int(self.pv_v11_cmd, 1 if bool(snap.get('V11', False)) else 0)
-        except Exception:
-            pass
-        try:
-            self._write_int(self.pv_v15_cmd, 1 if bool(snap.get('V15', False)) else 0)
-        except Exception:
-            pass
-        try:
-            self._write_int(self.pv_v19_cmd, 1 if bool(snap.get('V19', False)) else 0)
-        except Exception:
-            pass
-        try:
-            self._write_int(self.pv_v20_cmd, 1 if float(snap.get('V20', 0.0)) > 0.5 else 0)
-        except Exception:
-            pass
-        try:
-            self._write_int(self.pv_v17_cmd, 1 if float(snap.get('V17', 0.0)) > 0.5 else 0)
         except Exception:
-            pass
-        try:
-            self._write_int(self.pv_v10_cmd, 1 if float(snap.get('V10', 0.0)) > 0.5 else 0)
-        except Exception:
-            pass
-        try:
-            self._write_int(self.pv_v21_cmd, 1 if bool(snap.get('V21', False)) else 0)
-        except Exception:
-            pass
+            return
+        # 미러와 같은 비트마스크/테이블을 공유해 밸브당 개별 분기를 없앤다
+        bits = self._valve_bits(snap)
         try:
+            for bitpos, pv in enumerate(self._valve_cmd_pvs):
+                self._write_int(pv, (bits >> bitpos) & 1)
             self._write_int(self.pv_pump_cmd, 1 if float(snap.get('pump_hz', 0.0)) > 0.0 else 0)
-        except Exception:
-            pass
-        try:
             self._write_int(self.pv_heat_cmd, 1 if bool(snap.get('press_ctrl_on', False)) else 0)
         except Exception:
             pass
 
-    def _mirror_status_from_sim(self) -> None:
-        snap = self.seq.snapshot_status() if self.seq is not None else {}
-        self._write_int(self.pv_v9_status, 1 if bool(snap.get('V9', False)) else 0)
-        self._write_int(self.pv_v11_status, 1 if bool(snap.get('V11', False)) else 0)
-        self._write_int(self.pv_v15_status, 1 if bool(snap.get('V15', False)) else 0)
-        self._write_int(self.pv_v17_status, 1 if float(snap.get('V17', 0.0)) > 0.5 else 0)
-        self._write_int(self.pv_v19_status, 1 if bool(snap.get('V19', False)) else 0)
-        self._write_int(self.pv_v20_status, 1 if float(snap.get('V20', 0.0)) > 0.5 else 0)
-        self._write_int(self.pv_v10_status, 1 if float(snap.get('V10', 0.0)) > 0.5 else 0)
-        self._write_int(self.pv_v21_status, 1 if bool(snap.get('V21', False)) else 0)
+    @staticmethod
+    def _valve_bits(snap: dict) -> int:
+        """스냅샷의 8개 밸브 상태를 비트마스크로 묶는다.
+
+        비트 순서는 _valve_status_pvs/_valve_cmd_pvs와 같다. 아날로그
+        성격(V17/V20/V10)은 0.5 문턱으로 비트화한다.
+        """
+        return (
+            (1 if snap.get('V9') else 0)
+            | ((1 if snap.get('V11') else 0) << 1)
+            | ((1 if snap.get('V15') else 0) << 2)
+            | ((1 if snap.get('V17', 0.0) > 0.5 else 0) << 3)
+            | ((1 if snap.get('V19') else 0) << 4)
+            | ((1 if snap.get('V20', 0.0) > 0.5 else 0) << 5)
+            | ((1 if snap.get('V10', 0.0) > 0.5 else 0) << 6)
+            | ((1 if snap.get('V21') else 0) << 7)
+        )
+
+    def _mirror_status_from_sim(self, snap: dict) -> None:
+        """루프가 이미 만든 스냅샷을 받아 상태 PV를 미러링한다.
+
+        8개 상태를 uint8 비트마스크로 묶고 직전 마스크와 XOR하여 변경된
+        비트만 기록한다. 정상 운전의 전형(무변화)에서는 put이 0회다.
+        """
+        bits = self._valve_bits(snap)
+        last = self._last_valve_bits
+        changed = 0xFF if last is None else (bits ^ last)
+        if not changed:
+            return
+        self._last_valve_bits = bits
+        for bitpos, pv in enumerate(self._valve_status_pvs):
+            if changed & (1 << bitpos):
+                self._write_int(pv, (bits >> bitpos) & 1)
 
 
 
@@ -954,7 +1163,7 @@ class PVBridge:
             if not cfg_path:
                 return
             with open(cfg_path, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f) or {}
+                data = yaml.load(f, Loader=_YamlLoader) or {}
             # Note: tuning.yaml overlay is removed; use pv_init.yaml only.
             # PV 초기값만 적용
             pvs = data.get("pvs", {}) if isinstance(data, dict) else {}
@@ -962,17 +1171,23 @@ class PVBridge:
                 if self.verbose:
                     print("[pv_bridge] init-config: 'pvs' 키가 dict 형식이 아님")
                 return
-            for name, val in pvs.items():
-                try:
-                    pv = PV(str(name), auto_monitor=False)
-                    if not pv.wait_for_connection(timeout=0.5):
-                        if self.verbose:
-                            print(f"[pv_bridge] init-config: 연결 실패: {name}")
-                        continue
-                    pv.put(val, wait=False)
-                except Exception as e:
-                    if self.verbose:
-                        print(f"[pv_bridge] init-config 적용 오류 {name}: {e}")
+            if not pvs:
+                return
+            # 이름별 PV 생성 + 직렬 wait_for_connection 대신 caput_many로
+            # 연결/기록을 일괄 처리한다(연결은 병렬로 진행됨).
+            names = [str(name) for name in pvs.keys()]
+            try:
+                results = caput_many(
+                    names, list(pvs.values()), wait=False, connection_timeout=0.5
+                )
+            except Exception as e:
+                if self.verbose:
+                    print(f"[pv_bridge] init-config 적용 오류: {e}")
+                return
+            if self.verbose:
+                for name, ok in zip(names, results):
+                    if ok < 0:
+                        print(f"[pv_bridge] init-config: 적용 실패: {name}")
         except FileNotFoundError:
             if self.verbose:
                 print(f"[pv_bridge] init-config 파일 없음: {self.init_config}")
@@ -992,6 +1207,7 @@ def main(argv: list[str]) -> int:
         init_config=args.init_config,
         log_interval=args.log_interval,
         hist_interval=args.hist_interval,
+        hist_tail=args.hist_tail,
     )
     try:
         bridge.loop()